@@ -1,5 +1,5 @@
+import functools
 import logging
-import re
 from typing import Any
 
 import jpype
@@ -11,59 +11,141 @@ from irgen.attribute import (
     get_read_action_value,
 )
 
+_IPXACT_PACKAGES: dict[str, str] = {
+    "1685-2009": "org.ieee.ipxact.v2009",
+    "1685-2014": "org.ieee.ipxact.v2014",
+    "1685-2022": "org.ieee.ipxact.v2022",
+}
 
-def _parse_n_series(header: str) -> list[int] | None:
-    if not header or "{n}" not in header:
-        return None
+_RESERVED_FIELD_PATTERN = r"^(rsvd|reserved)\d*$"
 
-    match = re.search(r"n\s*=\s*range\(([^)]*)\)", header)
-    if match:
-        args = [arg.strip() for arg in match.group(1).split(",") if arg.strip()]
-        try:
-            if len(args) == 1:
-                start, end, step = 0, int(args[0]), 1
-            elif len(args) == 2:
-                start, end, step = int(args[0]), int(args[1]), 1
-            elif len(args) == 3:
-                start, end, step = int(args[0]), int(args[1]), int(args[2])
-            else:
-                return None
-        except ValueError:
-            return None
-        if step == 0:
-            return None
-        return list(range(start, end, step))
+_N_RANGE_PATTERN = (
+    r"n\s*=\s*range\(\s*(?P<first>-?\d+)\s*(?:,\s*(?P<second>-?\d+)\s*)?"
+    r"(?:,\s*(?P<step>-?\d+)\s*)?,?\s*\)"
+)
+_N_TILDE_PATTERN = r"n\s*=\s*(?P<start>\d+)\s*~\s*(?P<end>\d+)"
+_N_COUNT_PATTERN = r"n\s*=\s*(\d+)"
+
+
+def _n_series_expr(header: pl.Expr) -> pl.Expr:
+    """Build the list of `n` values for an expandable register header.
+
+    Supports `n=range(...)` (Python semantics), `n=a~b` (inclusive) and
+    `n=count`, checked in that order. Evaluates to null when the header is
+    not expandable or the expansion cannot be parsed.
+    """
+    # Scan each pattern once; the captures are read back as struct fields.
+    captures = pl.struct(
+        header.str.extract_groups(_N_RANGE_PATTERN).alias("range"),
+        header.str.extract_groups(_N_TILDE_PATTERN).alias("tilde"),
+        header.str.extract(_N_COUNT_PATTERN, 1).alias("count"),
+        header.str.contains("{n}", literal=True).alias("expandable"),
+    )
+    range_first = pl.field("range").struct.field("first").cast(pl.Int64)
+    range_second = pl.field("range").struct.field("second").cast(pl.Int64)
+    range_step = pl.field("range").struct.field("step").cast(pl.Int64)
+    tilde_start = pl.field("tilde").struct.field("start").cast(pl.Int64)
+    tilde_end = pl.field("tilde").struct.field("end").cast(pl.Int64)
+    count = pl.field("count").cast(pl.Int64)
+
+    start = (
+        pl.when(range_second.is_not_null())
+        .then(range_first)
+        .when(range_first.is_not_null())
+        .then(0)
+        .when(tilde_start.is_not_null())
+        .then(tilde_start)
+        .when(count.is_not_null())
+        .then(0)
+    )
+    end = (
+        pl.when(range_second.is_not_null())
+        .then(range_second)
+        .when(range_first.is_not_null())
+        .then(range_first)
+        .when(tilde_end.is_not_null())
+        .then(tilde_end + 1)
+        .otherwise(count)
+    )
+    step = range_step.fill_null(1)
+    # A zero step is invalid for range(); a null step makes int_ranges yield null.
+    step = pl.when(step != 0).then(step)
+
+    n_series = pl.when(pl.field("expandable")).then(pl.int_ranges(start, end, step))
+    return captures.struct.with_fields(n_series=n_series).struct.field("n_series")
 
-    match = re.search(r"n\s*=\s*(\d+)\s*~\s*(\d+)", header)
-    if match:
-        start, end = int(match.group(1)), int(match.group(2))
-        return list(range(start, end + 1))
 
-    match = re.search(r"n\s*=\s*(\d+)", header)
-    if match:
-        end = int(match.group(1))
-        return list(range(0, end))
+_BIT_RANGE_PATTERN = r"^\s*\[?\s*(?P<hi>\d+)\s*(?::\s*(?P<lo>\d+)\s*)?\]?\s*$"
+
+
+def _bit_range_expr(bit: pl.Expr) -> pl.Expr:
+    """Parse `[hi:lo]`, `hi:lo` or `[bit]` text into an Int64 `{hi, lo}` struct."""
+    groups = bit.cast(pl.String).str.extract_groups(_BIT_RANGE_PATTERN)
+    return groups.struct.with_fields(
+        hi=pl.field("hi").cast(pl.Int64),
+        lo=pl.coalesce(pl.field("lo"), pl.field("hi")).cast(pl.Int64),
+    )
+
+
+def _address_int_expr(value: pl.Expr) -> pl.Expr:
+    """Parse `0x`-prefixed hexadecimal or plain decimal address text to Int64."""
+    text = value.cast(pl.String).str.strip_chars().str.to_lowercase()
+    return (
+        pl.when(text.str.starts_with("0x"))
+        .then(text.str.strip_prefix("0x").str.to_integer(base=16, strict=False))
+        .otherwise(text.str.to_integer(base=10, strict=False))
+    )
+
+
+def _format_hex(values: pl.Series) -> pl.Series:
+    return pl.Series(
+        [None if value is None else f"0x{value:X}" for value in values.to_list()],
+        dtype=pl.String,
+    )
+
 
-    return None
+def _hex_expr(value: pl.Expr) -> pl.Expr:
+    """Format an integer expression as upper-case `0x...` text, one batch per call."""
+    return value.map_batches(_format_hex, return_dtype=pl.String, is_elementwise=True)
 
 
+_INT_PREFIX_BASES = {"0x": 16, "0b": 2, "0o": 8}
+
+
+@functools.lru_cache(maxsize=1024, typed=True)
 def _parse_default_int(value: Any) -> int | None:
     if value is None:
         return None
-    text = str(value).strip()
-    if not text or text.lower() == "null":
+    text = str(value).strip().lower()
+    if not text or text == "null":
         return None
+    base = _INT_PREFIX_BASES.get(text[:2])
     try:
-        return int(text, 0)
+        if base is None:
+            return int(text, 0)
+        digits = text[2:]
+        # Like int(text, 0): one "_" may follow the prefix, but no sign or space.
+        if digits[:1] == "_":
+            digits = digits[1:]
+        if not digits[:1].isalnum():
+            return None
+        return int(digits, base)
     except ValueError:
         return None
 
 
-def _parse_int(value: Any) -> int | None:
+def _field_reset(default_raw: Any, width: Any, bit_low: int) -> int:
+    """Return a field's default value masked to its width and shifted to bit_low."""
+    default_int = _parse_default_int(default_raw)
+    if default_int is None:
+        return 0
     try:
-        return int(value)
+        width_int = int(width)
     except (TypeError, ValueError):
-        return None
+        return 0
+    if width_int <= 0:
+        return 0
+    return (default_int & ((1 << width_int) - 1)) << int(bit_low)
 
 
 def _parse_text(value: Any) -> str | None:
@@ -75,38 +157,55 @@ def _parse_text(value: Any) -> str | None:
     return text
 
 
-def _parse_bit_range(value: Any) -> tuple[int, int] | None:
-    text = _parse_text(value)
-    if not text:
-        return None
-    text = text.strip()
-    if text.startswith("[") and text.endswith("]"):
-        text = text[1:-1]
-    text = text.replace(" ", "")
-    if ":" in text:
-        hi_text, lo_text = text.split(":", 1)
-    else:
-        hi_text, lo_text = text, text
-    try:
-        hi = int(hi_text)
-        lo = int(lo_text)
-    except ValueError:
-        return None
-    return (hi, lo)
+@functools.cache
+def _jclass(name: str) -> Any:
+    """Resolve a Java class once per process; requires a running JVM."""
+    return jpype.JClass(name)
 
 
-def _parse_bit_high(value: Any) -> int | None:
-    bit_range = _parse_bit_range(value)
-    if bit_range is None:
-        return None
-    return bit_range[0]
+@functools.cache
+def _enum_value(enum_type: Any, value: str) -> Any:
+    """Memoized `enum_type.fromValue(value)` for the IP-XACT enum types."""
+    return enum_type.fromValue(value)
 
 
-def _parse_bit_low(value: Any) -> int | None:
-    bit_range = _parse_bit_range(value)
-    if bit_range is None:
-        return None
-    return bit_range[1]
+@functools.cache
+def _lookup_attribute(
+    attribute: str,
+) -> tuple[str | None, str | None, str | None, tuple[str, ...]]:
+    """Resolve an ATTRIBUTE once, returning its values and the unknown kinds."""
+    unknown: list[str] = []
+    try:
+        access_value = get_access_value(attribute)
+    except KeyError:
+        access_value = None
+        unknown.append("access")
+    try:
+        modified_write_value = get_modified_write_value(attribute)
+    except KeyError:
+        modified_write_value = None
+        unknown.append("modified write")
+    try:
+        read_action_value = get_read_action_value(attribute)
+    except KeyError:
+        read_action_value = None
+        unknown.append("read action")
+    return access_value, modified_write_value, read_action_value, tuple(unknown)
+
+
+def _attribute_values(
+    attribute: str, reg_key: str
+) -> tuple[str | None, str | None, str | None]:
+    """Map an ATTRIBUTE cell to (access, modifiedWriteValue, readAction) values."""
+    access_value, modified_write_value, read_action_value, unknown = _lookup_attribute(
+        attribute
+    )
+    if attribute:
+        for kind in unknown:
+            logging.warning(
+                f"Unknown {kind} attribute '{attribute}' in register '{reg_key}'."
+            )
+    return access_value, modified_write_value, read_action_value
 
 
 def _set_description(obj: Any, value: Any) -> None:
@@ -122,8 +221,10 @@ def _set_description(obj: Any, value: Any) -> None:
         logging.warning(f"Failed to set description: {e}")
 
 
-def _validate_columns(df: pl.DataFrame, required: set[str], sheet_name: str) -> bool:
-    missing = required - set(df.columns)
+def _validate_columns(
+    df: pl.DataFrame | pl.LazyFrame, required: set[str], sheet_name: str
+) -> bool:
+    missing = required - set(df.collect_schema().names())
     if missing:
         missing_list = ", ".join(sorted(missing))
         logging.error(f"Missing required columns in sheet '{sheet_name}': {missing_list}")
@@ -131,15 +232,32 @@ def _validate_columns(df: pl.DataFrame, required: set[str], sheet_name: str) ->
     return True
 
 
-def parse_dataframe(df: pl.DataFrame) -> pl.DataFrame:
+_FORWARD_FILL_COLUMNS = ("ADDR", "REG", "STRIDE", "REG_SIZE")
+
+
+def _forward_fill(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Fill the register-level cells that are only written on a register's first row."""
+    columns = lf.collect_schema().names()
+    return lf.with_columns(
+        pl.col(name).forward_fill() for name in _FORWARD_FILL_COLUMNS if name in columns
+    )
+
+
+def parse_lazyframe(lf: pl.LazyFrame) -> pl.LazyFrame:
+    """Build the register parsing query without collecting it.
+
+    Callers can collect the result with the engine of their choice, e.g.
+    `engine="streaming"` for very large sheets.
+    """
+    columns = lf.collect_schema().names()
     stride_override_expr = (
         pl.col("STRIDE").cast(pl.Int64, strict=False)
-        if "STRIDE" in df.columns
+        if "STRIDE" in columns
         else pl.lit(None, dtype=pl.Int64)
     )
     reg_size_bits_expr = (
         pl.col("REG_SIZE").cast(pl.Int64, strict=False)
-        if "REG_SIZE" in df.columns
+        if "REG_SIZE" in columns
         else pl.lit(None, dtype=pl.Int64)
     )
 
@@ -155,13 +273,14 @@ def parse_dataframe(df: pl.DataFrame) -> pl.DataFrame:
         .otherwise(base_stride_expr)
     )
 
-    parsed_df = (
-        df.with_columns(
+    return (
+        # Keep the parsed BIT range as one column so its regex runs once per row.
+        lf.with_columns(bit_range=_bit_range_expr(pl.col("BIT")))
+        .with_columns(
             header_reg=pl.first("REG").over("ADDR"),
             start_addr_str=pl.first("ADDR").over("ADDR"),
-            bit_hi=pl.col("BIT").map_elements(
-                _parse_bit_high, return_dtype=pl.Int64
-            ),
+            bit_hi=pl.col("bit_range").struct.field("hi"),
+            bit_lo=pl.col("bit_range").struct.field("lo"),
             width_sum_bits=(
                 pl.col("WIDTH")
                 .filter(pl.col("FIELD").is_not_null() & (pl.col("FIELD") != ""))
@@ -170,16 +289,13 @@ def parse_dataframe(df: pl.DataFrame) -> pl.DataFrame:
             ),
         )
         .with_columns(
-            is_expandable=pl.col("header_reg").str.contains(r"\{n\}"),
+            is_expandable=pl.col("header_reg").str.contains("{n}", literal=True),
             base_reg_name=pl.coalesce(
-                pl.col("header_reg").str.extract(r"(.*?)\{n\}"), pl.lit("")
-            ),
-            start_addr_int=pl.col("start_addr_str")
-            .str.extract(r"0x([0-9a-fA-F]+)")
-            .str.to_integer(base=16, strict=True),
-            n_series=pl.col("header_reg").map_elements(
-                _parse_n_series, return_dtype=pl.List(pl.Int64)
+                pl.col("header_reg").str.splitn("{n}", 2).struct.field("field_0"),
+                pl.lit(""),
             ),
+            start_addr_int=_address_int_expr(pl.col("start_addr_str")),
+            n_series=_n_series_expr(pl.col("header_reg")),
             stride_bits=(
                 pl.col("bit_hi")
                 .filter(
@@ -194,40 +310,49 @@ def parse_dataframe(df: pl.DataFrame) -> pl.DataFrame:
         .with_columns(stride=stride_expr)
         .explode("n_series")
         .filter(
-            (pl.col("is_expandable") & pl.col("n_series").is_not_null())
-            | (
-                ~pl.col("is_expandable")
-                & pl.col("FIELD").is_not_null()
-                & (pl.col("FIELD") != "")
+            (
+                (pl.col("is_expandable") & pl.col("n_series").is_not_null())
+                | (
+                    ~pl.col("is_expandable")
+                    & pl.col("FIELD").is_not_null()
+                    & (pl.col("FIELD") != "")
+                )
             )
+            & ~pl.col("FIELD")
+            .cast(pl.String)
+            .str.contains(_RESERVED_FIELD_PATTERN)
+            .fill_null(False)
         )
         .with_columns(
             ADDR=pl.when(pl.col("is_expandable"))
             .then(
-                (
+                _hex_expr(
                     pl.col("start_addr_int") + pl.col("n_series") * pl.col("stride")
-                ).map_elements(lambda x: f"0x{x:X}", return_dtype=pl.String)
+                )
             )
             .otherwise(pl.col("ADDR")),
             REG=pl.when(pl.col("is_expandable"))
             .then(pl.col("base_reg_name") + "_" + pl.col("n_series").cast(pl.String))
             .otherwise(pl.col("REG")),
+            ATTRIBUTE=pl.col("ATTRIBUTE").cast(pl.String).str.strip_chars(),
+        )
+        .select(
+            "ADDR",
+            "REG",
+            "FIELD",
+            "BIT",
+            "WIDTH",
+            "ATTRIBUTE",
+            "DEFAULT",
+            "DESCRIPTION",
+            "stride",
+            "bit_lo",
         )
     )
 
-    parsed_df = parsed_df.select(
-        "ADDR",
-        "REG",
-        "FIELD",
-        "BIT",
-        "WIDTH",
-        "ATTRIBUTE",
-        "DEFAULT",
-        "DESCRIPTION",
-        "stride",
-    )
 
-    return parsed_df
+def parse_dataframe(df: pl.DataFrame | pl.LazyFrame) -> pl.DataFrame:
+    return parse_lazyframe(df.lazy()).collect()
 
 
 def process_vendor_sheet(df: pl.DataFrame, object_factory: Any) -> Any:
@@ -235,12 +360,13 @@ def process_vendor_sheet(df: pl.DataFrame, object_factory: Any) -> Any:
     if not _validate_columns(df, {"VENDOR", "LIBRARY", "NAME", "VERSION"}, "vendor"):
         return None
     try:
+        row = df.row(0, named=True)
         component = object_factory.createComponentType()
-        component.setVendor(str(df["VENDOR"][0]))
-        component.setLibrary(str(df["LIBRARY"][0]))
-        component.setName(str(df["NAME"][0]))
-        component.setVersion(str(df["VERSION"][0]))
-        _set_description(component, df["DESCRIPTION"][0] if "DESCRIPTION" in df.columns else None)
+        component.setVendor(str(row["VENDOR"]))
+        component.setLibrary(str(row["LIBRARY"]))
+        component.setName(str(row["NAME"]))
+        component.setVersion(str(row["VERSION"]))
+        _set_description(component, row.get("DESCRIPTION"))
 
         return component
     except (pl.exceptions.PolarsError, ValueError, KeyError) as e:
@@ -263,40 +389,45 @@ def process_address_map_sheet(
     if not _validate_columns(df, {"BLOCK", "OFFSET", "RANGE"}, "address_map"):
         return []
 
-    BigInteger = jpype.JClass("java.math.BigInteger")
+    BigInteger = _jclass("java.math.BigInteger")
+    names = df.get_column("BLOCK").to_list()
+    offsets = df.get_column("OFFSET").to_list()
+    ranges = df.get_column("RANGE").to_list()
+    descriptions = (
+        df.get_column("DESCRIPTION").to_list()
+        if "DESCRIPTION" in df.columns
+        else [None] * df.height
+    )
     address_blocks = []
-    for row in df.iter_rows(named=True):
-        try:
-            if ipxact_version == "1685-2009":
-                base_address = object_factory.createBaseAddress()
-            else:
-                base_address = object_factory.createUnsignedLongintExpression()
-            base_address.setValue(str(row["OFFSET"]))
-            if ipxact_version == "1685-2009":
-                block_range = object_factory.createBankedBlockTypeRange()
-            else:
-                block_range = object_factory.createUnsignedPositiveLongintExpression()
-            block_range.setValue(str(row["RANGE"]))
-            if ipxact_version == "1685-2022":
-                width = object_factory.createUnsignedPositiveIntExpression()
-                width.setValue("32")
-            elif ipxact_version == "1685-2014":
-                width = object_factory.createUnsignedIntExpression()
-                width.setValue("32")
-            else:
-                width = object_factory.createBankedBlockTypeWidth()
-                width.setValue(BigInteger.valueOf(32))
-            address_block = object_factory.createAddressBlockType()
-            address_block.setName(str(row["BLOCK"]))
-            address_block.setBaseAddress(base_address)
-            address_block.setRange(block_range)
-            address_block.setWidth(width)
-            _set_description(address_block, row.get("DESCRIPTION"))
-            address_blocks.append(address_block)
-        except KeyError as e:
-            logging.error(
-                f"Missing expected column in address_map sheet: {e}. Skipping row: {row}"
-            )
+    for name, offset, range_value, description in zip(
+        names, offsets, ranges, descriptions
+    ):
+        if ipxact_version == "1685-2009":
+            base_address = object_factory.createBaseAddress()
+        else:
+            base_address = object_factory.createUnsignedLongintExpression()
+        base_address.setValue(str(offset))
+        if ipxact_version == "1685-2009":
+            block_range = object_factory.createBankedBlockTypeRange()
+        else:
+            block_range = object_factory.createUnsignedPositiveLongintExpression()
+        block_range.setValue(str(range_value))
+        if ipxact_version == "1685-2022":
+            width = object_factory.createUnsignedPositiveIntExpression()
+            width.setValue("32")
+        elif ipxact_version == "1685-2014":
+            width = object_factory.createUnsignedIntExpression()
+            width.setValue("32")
+        else:
+            width = object_factory.createBankedBlockTypeWidth()
+            width.setValue(BigInteger.valueOf(32))
+        address_block = object_factory.createAddressBlockType()
+        address_block.setName(str(name))
+        address_block.setBaseAddress(base_address)
+        address_block.setRange(block_range)
+        address_block.setWidth(width)
+        _set_description(address_block, description)
+        address_blocks.append(address_block)
     return address_blocks
 
 
@@ -307,195 +438,248 @@ def process_register_sheet(
 
     if not jpype.isJVMStarted():
         raise
-    if not _validate_columns(df, {"ADDR", "REG", "FIELD", "BIT", "WIDTH"}, "register"):
+    lf = df.lazy()
+    if not _validate_columns(lf, {"ADDR", "REG", "FIELD", "BIT", "WIDTH"}, "register"):
         return []
 
-    match ipxact_version:
-        case "1685-2009":
-            AccessType = jpype.JClass("org.ieee.ipxact.v2009.AccessType")
-        case "1685-2014":
-            AccessType = jpype.JClass("org.ieee.ipxact.v2014.AccessType")
-            ModifiedWriteValueType = jpype.JClass(
-                "org.ieee.ipxact.v2014.ModifiedWriteValueType"
-            )
-            ReadActionType = jpype.JClass("org.ieee.ipxact.v2014.ReadActionType")
-        case "1685-2022":
-            AccessType = jpype.JClass("org.ieee.ipxact.v2022.AccessType")
-            ModifiedWriteValueType = jpype.JClass(
-                "org.ieee.ipxact.v2022.ModifiedWriteValueType"
+    package = _IPXACT_PACKAGES.get(ipxact_version)
+    if package is None:
+        raise ValueError(f"Unsupported IP-XACT version: {ipxact_version}")
+    AccessType = _jclass(f"{package}.AccessType")
+    if ipxact_version != "1685-2009":
+        ModifiedWriteValueType = _jclass(f"{package}.ModifiedWriteValueType")
+        ReadActionType = _jclass(f"{package}.ReadActionType")
+
+    BigInteger = _jclass("java.math.BigInteger")
+
+    # Bind the factory methods used per field once; each lookup crosses into JPype.
+    create_field = object_factory.createFieldType
+    if ipxact_version == "1685-2009":
+        create_bit_width = object_factory.createFieldTypeBitWidth
+    else:
+        create_bit_offset = object_factory.createUnsignedIntExpression
+        create_bit_width = object_factory.createUnsignedPositiveIntExpression
+        create_resets = object_factory.createFieldTypeResets
+        create_reset = object_factory.createReset
+        create_reset_value = object_factory.createUnsignedBitVectorExpression
+    if ipxact_version == "1685-2014":
+        create_modified_write = object_factory.createFieldTypeModifiedWriteValue
+        create_read_action = object_factory.createFieldTypeReadAction
+    elif ipxact_version == "1685-2022":
+        create_modified_write = object_factory.createModifiedWriteValue
+        create_read_action = object_factory.createReadAction
+        create_access_policies = object_factory.createFieldTypeFieldAccessPolicies
+        create_access_policy = (
+            object_factory.createFieldTypeFieldAccessPoliciesFieldAccessPolicy
+        )
+
+    def _new_field(field_name: Any, description: Any) -> Any:
+        field = create_field()
+        field.setName(str(field_name))
+        _set_description(field, description)
+        return field
+
+    def _set_bit_range(field: Any, bit_low: int, width: Any) -> None:
+        bit_offset = create_bit_offset()
+        bit_offset.setValue(str(bit_low))
+        bit_width = create_bit_width()
+        bit_width.setValue(str(width))
+        field.setBitOffset(bit_offset)
+        field.setBitWidth(bit_width)
+
+    def _set_reset(field: Any, default_raw: Any, reg_key: str) -> None:
+        default_text = str(default_raw)
+        if _parse_default_int(default_text) is None:
+            return
+        try:
+            resets = create_resets()
+            reset = create_reset()
+            reset_value = create_reset_value()
+            reset_value.setValue(default_text)
+            reset.setValue(reset_value)
+            reset_list = resets.getReset()
+            reset_list.add(reset)
+            field.setResets(resets)
+        except Exception as e:
+            logging.warning(
+                f"Failed to set reset value '{default_text}' in register '{reg_key}': {e}"
             )
-            ReadActionType = jpype.JClass("org.ieee.ipxact.v2022.ReadActionType")
-        case _:
-            raise ValueError(f"Unsupported IP-XACT version: {ipxact_version}")
 
-    BigInteger = jpype.JClass("java.math.BigInteger")
+    def _build_field_2009(
+        field_name: Any,
+        bit_low: int,
+        width: Any,
+        attribute: str,
+        default_raw: Any,
+        description: Any,
+        reg_key: str,
+    ) -> Any:
+        field = _new_field(field_name, description)
+        bit_width = create_bit_width()
+        bit_width.setValue(BigInteger.valueOf(int(width)))
+        field.setBitOffset(BigInteger.valueOf(int(bit_low)))
+        field.setBitWidth(bit_width)
+
+        access_value, modified_write_value, read_action_value = _attribute_values(
+            attribute, reg_key
+        )
+        if access_value is not None:
+            field.setAccess(_enum_value(AccessType, access_value))
+        if modified_write_value is not None:
+            field.setModifiedWriteValue(modified_write_value)
+        if read_action_value is not None:
+            field.setReadAction(read_action_value)
+        return field
+
+    def _build_field_2014(
+        field_name: Any,
+        bit_low: int,
+        width: Any,
+        attribute: str,
+        default_raw: Any,
+        description: Any,
+        reg_key: str,
+    ) -> Any:
+        field = _new_field(field_name, description)
+        _set_bit_range(field, bit_low, width)
+
+        access_value, modified_write_value, read_action_value = _attribute_values(
+            attribute, reg_key
+        )
+        if access_value is not None:
+            field.setAccess(_enum_value(AccessType, access_value))
+        if modified_write_value is not None:
+            modified_write = create_modified_write()
+            modified_write.setValue(
+                _enum_value(ModifiedWriteValueType, modified_write_value)
+            )
+            field.setModifiedWriteValue(modified_write)
+        if read_action_value is not None:
+            read_action = create_read_action()
+            read_action.setValue(_enum_value(ReadActionType, read_action_value))
+            field.setReadAction(read_action)
+
+        _set_reset(field, default_raw, reg_key)
+        return field
+
+    def _build_field_2022(
+        field_name: Any,
+        bit_low: int,
+        width: Any,
+        attribute: str,
+        default_raw: Any,
+        description: Any,
+        reg_key: str,
+    ) -> Any:
+        field = _new_field(field_name, description)
+        _set_bit_range(field, bit_low, width)
+
+        access_value, modified_write_value, read_action_value = _attribute_values(
+            attribute, reg_key
+        )
+        access_policy = create_access_policy()
+        if access_value is not None:
+            access_policy.setAccess(_enum_value(AccessType, access_value))
+        if modified_write_value is not None:
+            modified_write = create_modified_write()
+            modified_write.setValue(
+                _enum_value(ModifiedWriteValueType, modified_write_value)
+            )
+            access_policy.setModifiedWriteValue(modified_write)
+        if read_action_value is not None:
+            read_action = create_read_action()
+            read_action.setValue(_enum_value(ReadActionType, read_action_value))
+            access_policy.setReadAction(read_action)
+        if (
+            access_value is not None
+            or modified_write_value is not None
+            or read_action_value is not None
+        ):
+            access_policies = create_access_policies()
+            access_policy_list = access_policies.getFieldAccessPolicy()
+            access_policy_list.add(access_policy)
+            field.setFieldAccessPolicies(access_policies)
+
+        _set_reset(field, default_raw, reg_key)
+        return field
+
+    build_field = {
+        "1685-2009": _build_field_2009,
+        "1685-2014": _build_field_2014,
+        "1685-2022": _build_field_2022,
+    }[ipxact_version]
 
     try:
-        # Pre-process the dataframe
-        fill_cols = [pl.col("ADDR").forward_fill(), pl.col("REG").forward_fill()]
-        if "STRIDE" in df.columns:
-            fill_cols.append(pl.col("STRIDE").forward_fill())
-        if "REG_SIZE" in df.columns:
-            fill_cols.append(pl.col("REG_SIZE").forward_fill())
-        filled_df = df.with_columns(*fill_cols)
-        logging.debug(f"filled_df is {filled_df}")
-        parsed_df = parse_dataframe(filled_df)
-        logging.debug(f"parsed_df is {parsed_df}")
+        # Pre-process the dataframe; filling and parsing run as one lazy query.
+        filled_lf = _forward_fill(lf)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            # Only materialize the intermediate frame when it will be logged.
+            logging.debug("filled_df is %s", filled_lf.collect())
+        parsed_df = parse_dataframe(filled_lf)
+        logging.debug("parsed_df is %s", parsed_df)
     except pl.exceptions.PolarsError as e:
         logging.error(f"Polars error during pre-processing of a register sheet: {e}")
         return []
+    if parsed_df.is_empty():
+        return []
 
     registers = []
     # Group by register to process all its fields together
-    for reg_name, group in parsed_df.group_by("REG", maintain_order=True):
-        reg_key = reg_name[0] if isinstance(reg_name, tuple) else reg_name
+    for group in parsed_df.partition_by("REG", maintain_order=True):
+        reg_key = group.get_column("REG")[0]
         if not reg_key:
             logging.warning("Skipping rows with no register name.")
             continue
 
         fields: list[Any] = []
+        add_field = fields.append
         first_row = group.row(0, named=True)
         _set_description_from_row = first_row.get("DESCRIPTION")
 
         total_field_reset = 0
 
-        for field_row in group.iter_rows(named=True):
+        columns = [
+            group.get_column(name).to_list()
+            for name in (
+                "FIELD",
+                "BIT",
+                "bit_lo",
+                "WIDTH",
+                "ATTRIBUTE",
+                "DEFAULT",
+                "DESCRIPTION",
+            )
+        ]
+        for (
+            field_name,
+            bit,
+            bit_low,
+            width,
+            attribute,
+            default_raw,
+            description,
+        ) in zip(*columns):
             try:
-                bit_range = _parse_bit_range(field_row["BIT"])
-                if not bit_range:
-                    raise ValueError(
-                        f"Could not parse bit offset from '{field_row['BIT']}"
-                    )
-
-                if re.match(r"^(rsvd|reserved)\d*$", str(field_row["FIELD"])):
-                    continue
-
-                field = object_factory.createFieldType()
-                bit_low = bit_range[1]
-                if ipxact_version != "1685-2009":
-                    bit_offset = object_factory.createUnsignedIntExpression()
-                    bit_offset.setValue(str(bit_low))
-                if ipxact_version != "1685-2009":
-                    bit_width = object_factory.createUnsignedPositiveIntExpression()
-                    bit_width.setValue(str(field_row["WIDTH"]))
-                else:
-                    bit_width = object_factory.createFieldTypeBitWidth()
-                    bit_width.setValue(BigInteger.valueOf(int(field_row["WIDTH"])))
-                field.setName(str(field_row["FIELD"]))
-                _set_description(field, field_row.get("DESCRIPTION"))
-                if ipxact_version != "1685-2009":
-                    field.setBitOffset(bit_offset)
-                else:
-                    field.setBitOffset(BigInteger.valueOf(int(bit_low)))
-                field.setBitWidth(bit_width)
-
-                attribute = str(field_row.get("ATTRIBUTE", "")).strip()
-                access_policy_used = False
-                if ipxact_version == "1685-2022":
-                    access_policies = (
-                        object_factory.createFieldTypeFieldAccessPolicies()
-                    )
-                    access_policy = object_factory.createFieldTypeFieldAccessPoliciesFieldAccessPolicy()
-
-                try:
-                    access_value = get_access_value(attribute)
-                except KeyError:
-                    access_value = None
-                    if attribute:
-                        logging.warning(
-                            f"Unknown access attribute '{attribute}' in register '{reg_key}'."
-                        )
-                if access_value is not None:
-                    if ipxact_version == "1685-2022":
-                        access_policy.setAccess(AccessType.fromValue(access_value))
-                        access_policy_used = True
-                    else:
-                        field.setAccess(AccessType.fromValue(access_value))
-
-                try:
-                    modified_write_value = get_modified_write_value(attribute)
-                except KeyError:
-                    modified_write_value = None
-                    if attribute:
-                        logging.warning(
-                            f"Unknown modified write attribute '{attribute}' in register '{reg_key}'."
-                        )
-                if modified_write_value is not None:
-                    if ipxact_version == "1685-2022":
-                        modified_write = object_factory.createModifiedWriteValue()
-                    elif ipxact_version == "1685-2014":
-                        modified_write = (
-                            object_factory.createFieldTypeModifiedWriteValue()
-                        )
-                    if ipxact_version != "1685-2009":
-                        modified_write.setValue(
-                            ModifiedWriteValueType.fromValue(modified_write_value)
-                        )
-                    if ipxact_version == "1685-2022":
-                        access_policy.setModifiedWriteValue(modified_write)
-                        access_policy_used = True
-                    elif ipxact_version == "1685-2014":
-                        field.setModifiedWriteValue(modified_write)
-                    else:
-                        field.setModifiedWriteValue(modified_write_value)
-
-                try:
-                    read_action_value = get_read_action_value(attribute)
-                except KeyError:
-                    read_action_value = None
-                    if attribute:
-                        logging.warning(
-                            f"Unknown read action attribute '{attribute}' in register '{reg_key}'."
-                        )
-                if read_action_value is not None:
-                    if ipxact_version == "1685-2022":
-                        read_action = object_factory.createReadAction()
-                    elif ipxact_version == "1685-2014":
-                        read_action = object_factory.createFieldTypeReadAction()
-                    if ipxact_version != "1685-2009":
-                        read_action.setValue(
-                            ReadActionType.fromValue(read_action_value)
-                        )
-                    if ipxact_version == "1685-2022":
-                        access_policy.setReadAction(read_action)
-                        access_policy_used = True
-                    elif ipxact_version == "1685-2014":
-                        field.setReadAction(read_action)
-                    else:
-                        field.setReadAction(read_action_value)
-
-                if ipxact_version == "1685-2022" and access_policy_used:
-                    access_policy_list = access_policies.getFieldAccessPolicy()
-                    access_policy_list.add(access_policy)
-                    field.setFieldAccessPolicies(access_policies)
-
-                default_raw = field_row.get("DEFAULT")
-                default_int = _parse_default_int(default_raw)
-                if ipxact_version != "1685-2009" and default_int is not None:
-                    try:
-                        resets = object_factory.createFieldTypeResets()
-                        reset = object_factory.createReset()
-                        reset_value = object_factory.createUnsignedBitVectorExpression()
-                        reset_value.setValue(str(default_raw))
-                        reset.setValue(reset_value)
-                        reset_list = resets.getReset()
-                        reset_list.add(reset)
-                        field.setResets(resets)
-                    except Exception as e:
-                        logging.warning(
-                            f"Failed to set reset value '{default_raw}' in register '{reg_key}': {e}"
-                        )
-
-                fields.append(field)
-
-                if default_int is not None:
-                    width_int = _parse_int(field_row.get("WIDTH"))
-                    if width_int is not None and width_int > 0:
-                        mask = (1 << width_int) - 1
-                        total_field_reset += (default_int & mask) << int(bit_low)
+                if bit_low is None:
+                    raise ValueError(f"Could not parse bit offset from '{bit}")
+
+                field = build_field(
+                    field_name,
+                    bit_low,
+                    width,
+                    str(attribute),
+                    default_raw,
+                    description,
+                    reg_key,
+                )
+                add_field(field)
+
+                if ipxact_version == "1685-2009":
+                    # Python ints: registers may be wider than Polars' 64-bit ints.
+                    total_field_reset += _field_reset(default_raw, width, bit_low)
             except (KeyError, ValueError, TypeError) as e:
                 logging.error(
-                    f"Skipping invalid field '{field_row.get('FIELD', 'N/A')}' in register '{reg_key}': {e}"
+                    f"Skipping invalid field '{field_name}' in register '{reg_key}': {e}"
                 )
 
         if fields:
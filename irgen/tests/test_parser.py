@@ -3,15 +3,22 @@ import polars as pl
 from irgen import parser
 
 
+def _n_series(header: str) -> list[int] | None:
+    df = pl.DataFrame({"REG": [header]})
+    return df.select(parser._n_series_expr(pl.col("REG"))).to_series().to_list()[0]
+
+
 def test_parse_n_series_range() -> None:
-    assert parser._parse_n_series("rega{n}, n=range(3)") == [0, 1, 2]
-    assert parser._parse_n_series("rega{n}, n=range(1,4)") == [1, 2, 3]
-    assert parser._parse_n_series("rega{n}, n=range(0,4,2)") == [0, 2]
+    assert _n_series("rega{n}, n=range(3)") == [0, 1, 2]
+    assert _n_series("rega{n}, n=range(1,4)") == [1, 2, 3]
+    assert _n_series("rega{n}, n=range(0,4,2)") == [0, 2]
+    assert _n_series("rega{n}, n=range(0,4,0)") is None
 
 
 def test_parse_n_series_tilde_and_count() -> None:
-    assert parser._parse_n_series("rega{n}, n=0~2") == [0, 1, 2]
-    assert parser._parse_n_series("rega{n}, n=3") == [0, 1, 2]
+    assert _n_series("rega{n}, n=0~2") == [0, 1, 2]
+    assert _n_series("rega{n}, n=3") == [0, 1, 2]
+    assert _n_series("rega, n=3") is None
 
 
 def test_parse_dataframe_expansion() -> None:
@@ -33,9 +40,98 @@ def test_parse_dataframe_expansion() -> None:
     assert parsed["ADDR"].to_list() == ["0x10", "0x14", "0x18"]
     assert parsed["stride"].unique().to_list() == [4]
 
+    parsed = parser.parse_dataframe(
+        df.with_columns(REG=pl.lit("寄存器{n}, n=2"), ADDR=pl.lit("0x0"))
+    )
+    assert parsed["REG"].to_list() == ["寄存器_0", "寄存器_1"]
+    assert parsed["ADDR"].to_list() == ["0x0", "0x4"]
+
+
+def test_parse_lazyframe_streaming() -> None:
+    lf = pl.LazyFrame(
+        {
+            "ADDR": ["0x0", None, "0x10"],
+            "REG": ["ctrl", None, "rega{n}, n=0~1"],
+            "FIELD": ["en", "mode", "field0"],
+            "BIT": ["[0]", "[3:1]", "[15:0]"],
+            "WIDTH": [1, 3, 16],
+            "ATTRIBUTE": ["RW", "RW", "RO"],
+            "DEFAULT": ["0x1", "0x0", "0x0"],
+            "DESCRIPTION": ["", "", ""],
+        }
+    )
+
+    parsed = parser.parse_lazyframe(parser._forward_fill(lf)).collect(
+        engine="streaming"
+    )
+    assert parsed["ADDR"].to_list() == ["0x0", "0x0", "0x10", "0x12"]
+    assert parsed["REG"].to_list() == ["ctrl", "ctrl", "rega_0", "rega_1"]
+    assert parsed["bit_lo"].to_list() == [0, 1, 0, 0]
+
+
+def test_parse_dataframe_drops_reserved_fields() -> None:
+    df = pl.DataFrame(
+        {
+            "ADDR": ["0x0", None, None],
+            "REG": ["reg0", None, None],
+            "FIELD": ["field0", "rsvd", "reserved1"],
+            "BIT": ["[7:0]", "[15:8]", "[31:16]"],
+            "WIDTH": [8, 8, 16],
+            "ATTRIBUTE": ["RW", "RO", "RO"],
+            "DEFAULT": ["0x0", "0x0", "0x0"],
+            "DESCRIPTION": ["", "", ""],
+        }
+    ).with_columns(pl.col("ADDR").forward_fill(), pl.col("REG").forward_fill())
+
+    parsed = parser.parse_dataframe(df)
+    assert parsed["FIELD"].to_list() == ["field0"]
+    assert parsed["stride"].to_list() == [4]
+
+
+def test_field_reset() -> None:
+    assert parser._field_reset("0x1", 1, 0) + parser._field_reset("0b1101", 3, 1) == 0xB
+    assert parser._field_reset("-1", 4, 0) == 0xF
+    assert parser._field_reset("0x1_0", 8, 0) == 0x10
+    assert parser._field_reset("0xZZ", 8, 0) == 0
+    assert parser._field_reset("0x1", None, 0) == 0
+
+
+def test_field_reset_wider_than_64_bits() -> None:
+    total = parser._field_reset("0xFFFFFFFFFFFFFFFF", 64, 0) + parser._field_reset(
+        "0xFF", 8, 64
+    )
+    assert hex(total) == "0xffffffffffffffffff"
+    assert parser._field_reset("0x123456789ABCDEF01", 68, 0) == 0x123456789ABCDEF01
+
+
+def test_bit_range_expr() -> None:
+    df = pl.DataFrame({"BIT": ["[31:0]", "[7]", "15:8", " [3 : 1] ", "bad"]})
+    ranges = df.select(parser._bit_range_expr(pl.col("BIT"))).unnest("BIT")
+    assert ranges["hi"].to_list() == [31, 7, 15, 3, None]
+    assert ranges["lo"].to_list() == [0, 7, 8, 1, None]
+
+
+def test_address_int_expr() -> None:
+    addresses = pl.Series(["0x10", " 0X1f ", "32", "bogus"])
+    values = pl.select(parser._address_int_expr(pl.lit(addresses))).to_series()
+    assert values.to_list() == [16, 31, 32, None]
+
+
+def test_hex_expr() -> None:
+    values = pl.Series([0, 0x14, 0xDEADBEEF, None])
+    hex_values = pl.select(parser._hex_expr(pl.lit(values))).to_series()
+    assert hex_values.to_list() == ["0x0", "0x14", "0xDEADBEEF", None]
+
 
 def test_parse_default_int() -> None:
     assert parser._parse_default_int("0x10") == 16
+    assert parser._parse_default_int("0XfF") == 255
+    assert parser._parse_default_int("0b101") == 5
     assert parser._parse_default_int("10") == 10
+    assert parser._parse_default_int("0x_10") == 16
+    assert parser._parse_default_int("0xZZ") is None
+    assert parser._parse_default_int("0x-1") is None
+    assert parser._parse_default_int("0x 1f") is None
+    assert parser._parse_default_int("0x") is None
     assert parser._parse_default_int("null") is None
     assert parser._parse_default_int(None) is None